@@ -1,35 +1,46 @@
 import fitz  # PyMuPDF
 
-def extract_headers_and_content(pdf_path, output_path):
-    doc = fitz.open(pdf_path)
+def extract_sections(pdf_path):
+    """
+    Splits a PDF into sections keyed by large-font headers.
+    Returns a list of (page_number, header, content) tuples, where
+    page_number is the 1-based page the header appears on.
+    """
     sections = []
+    current_page = None
     current_header = None
     current_content = []
 
-    for page in doc:
-        blocks = page.get_text("dict")["blocks"]
-        for block in blocks:
-            if "lines" not in block:
-                continue
-            for line in block["lines"]:
-                for span in line["spans"]:
-                    text = span["text"].strip()
-                    font_size = span["size"]
-                    # Adjust font size threshold as needed for your PDF
-                    if font_size > 14 and text:
-                        if current_header:
-                            sections.append((current_header, " ".join(current_content).strip()))
-                        current_header = text
-                        current_content = []
-                    else:
-                        if current_header:
-                            current_content.append(text)
+    with fitz.open(pdf_path) as doc:
+        for page_number, page in enumerate(doc, 1):
+            blocks = page.get_text("dict")["blocks"]
+            for block in blocks:
+                if "lines" not in block:
+                    continue
+                for line in block["lines"]:
+                    for span in line["spans"]:
+                        text = span["text"].strip()
+                        font_size = span["size"]
+                        # Adjust font size threshold as needed for your PDF
+                        if font_size > 14 and text:
+                            if current_header:
+                                sections.append((current_page, current_header, " ".join(current_content).strip()))
+                            current_page = page_number
+                            current_header = text
+                            current_content = []
+                        else:
+                            if current_header:
+                                current_content.append(text)
     if current_header:
-        sections.append((current_header, " ".join(current_content).strip()))
+        sections.append((current_page, current_header, " ".join(current_content).strip()))
+    return sections
+
+def extract_headers_and_content(pdf_path, output_path):
+    sections = extract_sections(pdf_path)
 
     # Write to output file
     with open(output_path, "w", encoding="utf-8") as f:
-        for header, content in sections:
+        for _, header, content in sections:
             f.write(f"{header}\n")
             f.write(f"{content}\n\n")
 
@@ -0,0 +1,249 @@
+import argparse
+import hashlib
+import os
+import sqlite3
+
+DEFAULT_DB_PATH = "pdf_sections.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    mtime REAL NOT NULL,
+    size INTEGER NOT NULL,
+    sha256 TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sections (
+    id INTEGER PRIMARY KEY,
+    document_id INTEGER NOT NULL REFERENCES documents(id) ON DELETE CASCADE,
+    page INTEGER NOT NULL,
+    header TEXT NOT NULL,
+    content TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sections_document_id ON sections(document_id);
+CREATE VIRTUAL TABLE IF NOT EXISTS sections_fts USING fts5(
+    header, content, content='sections', content_rowid='id',
+    tokenize="unicode61 tokenchars '+#'"
+);
+CREATE TRIGGER IF NOT EXISTS sections_ai AFTER INSERT ON sections BEGIN
+    INSERT INTO sections_fts(rowid, header, content)
+    VALUES (new.id, new.header, new.content);
+END;
+CREATE TRIGGER IF NOT EXISTS sections_ad AFTER DELETE ON sections BEGIN
+    INSERT INTO sections_fts(sections_fts, rowid, header, content)
+    VALUES ('delete', old.id, old.header, old.content);
+END;
+"""
+
+def open_index(db_path=DEFAULT_DB_PATH):
+    """
+    Opens (creating if needed) the SQLite section index and returns the connection.
+    """
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.execute("PRAGMA journal_mode = WAL")
+    row = conn.execute(
+        "SELECT sql FROM sqlite_master WHERE name = 'sections_fts'"
+    ).fetchone()
+    rebuild = row is not None and "tokenchars" not in row[0]
+    if rebuild:
+        # Index created before "+" and "#" were token characters: recreate the
+        # FTS table and rebuild it from the sections table.
+        conn.execute("DROP TABLE sections_fts")
+    conn.executescript(SCHEMA)
+    if rebuild:
+        with conn:
+            conn.execute("INSERT INTO sections_fts(sections_fts) VALUES ('rebuild')")
+    return conn
+
+def _file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _find_pdfs(paths):
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                for name in sorted(files):
+                    if name.lower().endswith(".pdf"):
+                        yield os.path.abspath(os.path.join(root, name))
+        else:
+            yield os.path.abspath(path)
+
+def index_pdf(conn, pdf_path):
+    """
+    Indexes a single PDF, skipping it when it is unchanged since the last run.
+    Returns True if the document was (re)indexed, False if it was up to date.
+    Raises ValueError for non-PDF paths, OSError for unreadable files and
+    RuntimeError (PyMuPDF's error base) for files that fail to parse.
+    """
+    from extract_headers_content import extract_sections
+
+    pdf_path = os.path.abspath(pdf_path)
+    if not pdf_path.lower().endswith(".pdf"):
+        raise ValueError("not a PDF file")
+    stat = os.stat(pdf_path)
+    row = conn.execute(
+        "SELECT id, mtime, size, sha256 FROM documents WHERE path = ?", (pdf_path,)
+    ).fetchone()
+    if row and row[1] == stat.st_mtime and row[2] == stat.st_size:
+        return False
+
+    sha256 = _file_sha256(pdf_path)
+    if row and row[3] == sha256:
+        # Touched but not modified: just remember the new mtime.
+        conn.execute("UPDATE documents SET mtime = ? WHERE id = ?", (stat.st_mtime, row[0]))
+        conn.commit()
+        return False
+
+    sections = extract_sections(pdf_path)
+    with conn:
+        if row:
+            conn.execute("DELETE FROM documents WHERE id = ?", (row[0],))
+        cursor = conn.execute(
+            "INSERT INTO documents (path, mtime, size, sha256) VALUES (?, ?, ?, ?)",
+            (pdf_path, stat.st_mtime, stat.st_size, sha256),
+        )
+        document_id = cursor.lastrowid
+        conn.executemany(
+            "INSERT INTO sections (document_id, page, header, content) VALUES (?, ?, ?, ?)",
+            [(document_id, page, header, content) for page, header, content in sections],
+        )
+    return True
+
+def _drop_document(conn, path):
+    # Sections and their FTS rows go with it via ON DELETE CASCADE + trigger.
+    with conn:
+        cursor = conn.execute("DELETE FROM documents WHERE path = ?", (path,))
+    return cursor.rowcount > 0
+
+def update_index(conn, paths, prune=True):
+    """
+    Incrementally indexes every PDF under the given files/directories.
+    With prune=True, indexed documents that no longer exist are dropped when they
+    were passed explicitly as a file or live anywhere under a passed directory.
+    Files that cannot be read or parsed are reported and skipped; if such a file
+    was indexed before, its stale sections are dropped rather than kept.
+    Returns a dict with counts of indexed, unchanged, failed and removed documents.
+    """
+    stats = {"indexed": 0, "unchanged": 0, "failed": 0, "removed": 0}
+    seen = set()
+    for pdf_path in _find_pdfs(paths):
+        seen.add(pdf_path)
+        if prune and not os.path.exists(pdf_path) and _drop_document(conn, pdf_path):
+            print(f"🗑️  Removed: {pdf_path}")
+            stats["removed"] += 1
+            continue
+        try:
+            indexed = index_pdf(conn, pdf_path)
+        except (ValueError, OSError, RuntimeError) as e:
+            if os.path.exists(pdf_path) and _drop_document(conn, pdf_path):
+                print(f"⚠️  Skipped: {pdf_path} ({e}); dropped its previously indexed sections")
+            else:
+                print(f"⚠️  Skipped: {pdf_path} ({e})")
+            stats["failed"] += 1
+            continue
+        if indexed:
+            print(f"📄 Indexed: {pdf_path}")
+            stats["indexed"] += 1
+        else:
+            stats["unchanged"] += 1
+
+    if prune:
+        roots = [os.path.abspath(p) for p in paths if os.path.isdir(p)]
+        for (path,) in conn.execute("SELECT path FROM documents").fetchall():
+            under_root = any(path.startswith(root + os.sep) for root in roots)
+            if path not in seen and under_root and not os.path.exists(path):
+                _drop_document(conn, path)
+                print(f"🗑️  Removed: {path}")
+                stats["removed"] += 1
+    return stats
+
+def _quote_query(query):
+    # Quote each whitespace-separated token so punctuation is never parsed as
+    # FTS5 syntax. "+" and "#" are token characters, so "C++" and "c#" match
+    # as written; other punctuation separates words, so "page-object" matches
+    # the phrase "page object".
+    return " ".join('"' + token.replace('"', '""') + '"' for token in query.split())
+
+def search(conn, query, header_only=False, limit=20, raw=False):
+    """
+    Searches the index for sections containing every keyword, best matches first.
+    Header matches are weighted above content matches.
+    With raw=True the query is passed through as FTS5 syntax (prefix*, OR, NEAR...).
+    Returns a list of (path, page, header, snippet) tuples.
+    """
+    if not raw:
+        query = _quote_query(query)
+    if header_only:
+        query = f"header : ({query})"
+    rows = conn.execute(
+        """
+        SELECT d.path, s.page, s.header,
+               COALESCE(NULLIF(snippet(sections_fts, 1, '[', ']', '...', 12), ''),
+                        substr(s.content, 1, 80))
+        FROM sections_fts
+        JOIN sections s ON s.id = sections_fts.rowid
+        JOIN documents d ON d.id = s.document_id
+        WHERE sections_fts MATCH ?
+        ORDER BY bm25(sections_fts, 5.0, 1.0)
+        LIMIT ?
+        """,
+        (query, limit),
+    )
+    return rows.fetchall()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Full-text index over PDF header/content sections."
+    )
+    parser.add_argument("--db", default=DEFAULT_DB_PATH, help="SQLite index file")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    index_parser = subparsers.add_parser("index", help="add or refresh PDFs in the index")
+    index_parser.add_argument("paths", nargs="+", help="PDF files or directories")
+    index_parser.add_argument(
+        "--no-prune", action="store_true", help="keep entries for deleted PDFs"
+    )
+
+    search_parser = subparsers.add_parser("search", help="query the index by keywords")
+    search_parser.add_argument("query")
+    search_parser.add_argument(
+        "--header", action="store_true", help="match against section headers only"
+    )
+    search_parser.add_argument(
+        "--raw", action="store_true", help="treat the query as raw FTS5 syntax"
+    )
+    search_parser.add_argument("--limit", type=int, default=20)
+
+    args = parser.parse_args(argv)
+    conn = open_index(args.db)
+    try:
+        if args.command == "index":
+            stats = update_index(conn, args.paths, prune=not args.no_prune)
+            print(
+                f"✅ {stats['indexed']} indexed, {stats['unchanged']} unchanged, "
+                f"{stats['failed']} failed, {stats['removed']} removed"
+            )
+        else:
+            try:
+                results = search(
+                    conn, args.query, header_only=args.header, limit=args.limit, raw=args.raw
+                )
+            except sqlite3.OperationalError as e:
+                print(f"❌ Invalid query: {e}")
+                return
+            if not results:
+                print("❌ No matches found.")
+            for path, page, header, snippet in results:
+                print(f"{path} (page {page}) — {header}")
+                if snippet:
+                    print(f"    {snippet}")
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    main()
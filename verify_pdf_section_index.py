@@ -0,0 +1,133 @@
+import os
+import shutil
+import tempfile
+
+import fitz  # PyMuPDF
+
+from pdf_section_index import open_index, search, update_index
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SAMPLE_PDF = os.path.join(HERE, "fluent_pattern_fixed.pdf")
+OTHER_PDF = os.path.join(HERE, "fluent_pattern_redesigned.pdf")
+
+def section_count(conn, path):
+    return conn.execute(
+        "SELECT COUNT(*) FROM sections s JOIN documents d ON d.id = s.document_id "
+        "WHERE d.path = ?",
+        (path,),
+    ).fetchone()[0]
+
+def write_language_pdf(path):
+    # Headers are detected by font size (> 14), see extract_headers_content.
+    with fitz.open() as doc:
+        page = doc.new_page()
+        page.insert_text((72, 72), "Languages", fontsize=16)
+        page.insert_text((72, 100), "written in C and c# code", fontsize=11)
+        page.insert_text((72, 140), "Templates", fontsize=16)
+        page.insert_text((72, 168), "generic code in C++ only", fontsize=11)
+        doc.save(path)
+
+def check_fts_integrity(conn):
+    # Raises sqlite3.DatabaseError if the FTS table drifted from `sections`.
+    conn.execute("INSERT INTO sections_fts(sections_fts) VALUES ('integrity-check')")
+
+def main():
+    """Index -> re-index unchanged -> touch -> modify -> prune against a temp database"""
+    print("=== PDF Section Index Verification ===\n")
+    with tempfile.TemporaryDirectory() as tmp:
+        library = os.path.join(tmp, "lib")
+        os.makedirs(library)
+        doc_path = os.path.join(library, "doc.pdf")
+        shutil.copy(SAMPLE_PDF, doc_path)
+        with open(os.path.join(library, "bad.pdf"), "w") as f:
+            f.write("not a pdf")
+
+        conn = open_index(os.path.join(tmp, "index.db"))
+        try:
+            print("Initial index...")
+            stats = update_index(conn, [library])
+            assert stats == {"indexed": 1, "unchanged": 0, "failed": 1, "removed": 0}, stats
+            original_sections = section_count(conn, doc_path)
+            assert original_sections > 0
+
+            print("Re-index with no changes (mtime/size skip)...")
+            stats = update_index(conn, [library])
+            assert stats["indexed"] == 0 and stats["unchanged"] == 1, stats
+
+            print("Re-index after touch (sha256 unchanged)...")
+            mtime = os.stat(doc_path).st_mtime + 10
+            os.utime(doc_path, (mtime, mtime))
+            stats = update_index(conn, [library])
+            assert stats["indexed"] == 0 and stats["unchanged"] == 1, stats
+            stored_mtime = conn.execute(
+                "SELECT mtime FROM documents WHERE path = ?", (doc_path,)
+            ).fetchone()[0]
+            assert stored_mtime == os.stat(doc_path).st_mtime
+
+            print("Re-index after modification (sections replaced)...")
+            shutil.copy(OTHER_PDF, doc_path)
+            os.utime(doc_path, (mtime + 10, mtime + 10))
+            stats = update_index(conn, [library])
+            assert stats["indexed"] == 1, stats
+            assert conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0] == 1
+            assert section_count(conn, doc_path) == conn.execute(
+                "SELECT COUNT(*) FROM sections"
+            ).fetchone()[0]
+            check_fts_integrity(conn)
+
+            print("Searching...")
+            assert search(conn, "Key Benefits", header_only=True)
+            assert not search(conn, "known as Method Chaining", header_only=True)
+            assert search(conn, "known as Method Chaining")
+            assert search(conn, "page-object")
+
+            print("Searching punctuation in tokens (C, C++, c#)...")
+            lang_path = os.path.join(tmp, "lang.pdf")
+            write_language_pdf(lang_path)
+            stats = update_index(conn, [lang_path])
+            assert stats["indexed"] == 1, stats
+            assert [r[2] for r in search(conn, "C++")] == ["Templates"]
+            assert [r[2] for r in search(conn, "C")] == ["Languages"]
+            assert [r[2] for r in search(conn, "c#")] == ["Languages"]
+            os.remove(lang_path)
+            stats = update_index(conn, [lang_path])
+            assert stats["removed"] == 1, stats
+
+            print("Prune after deletion...")
+            os.remove(doc_path)
+            stats = update_index(conn, [library])
+            assert stats["removed"] == 1, stats
+            assert conn.execute("SELECT COUNT(*) FROM sections").fetchone()[0] == 0
+            check_fts_integrity(conn)
+
+            print("Explicitly indexed file...")
+            solo_path = os.path.join(tmp, "solo.pdf")
+            shutil.copy(SAMPLE_PDF, solo_path)
+            stats = update_index(conn, [solo_path])
+            assert stats["indexed"] == 1, stats
+
+            print("Re-index after the file becomes unparseable (old sections dropped)...")
+            with open(solo_path, "w") as f:
+                f.write("not a pdf anymore")
+            stats = update_index(conn, [solo_path])
+            assert stats["failed"] == 1, stats
+            assert section_count(conn, solo_path) == 0
+            assert not search(conn, "Key Benefits")
+            shutil.copy(SAMPLE_PDF, solo_path)
+            stats = update_index(conn, [solo_path])
+            assert stats["indexed"] == 1, stats
+
+            os.remove(solo_path)
+            stats = update_index(conn, [solo_path])
+            assert stats["removed"] == 1 and stats["failed"] == 0, stats
+            assert not search(conn, "Key Benefits")
+            stats = update_index(conn, [solo_path])
+            assert stats["failed"] == 1 and stats["removed"] == 0, stats
+            check_fts_integrity(conn)
+        finally:
+            conn.close()
+
+    print("\n✅ PDF section index verification passed.")
+
+if __name__ == "__main__":
+    main()